@@ -0,0 +1,80 @@
+from array import array
+import sys
+
+from instruction import BranchInstruction
+from parser import Parser
+
+# array typecode whose items are exactly 32 bits; 'I' is only guaranteed to be at least 16.
+WORD_TYPECODE = next(typecode for typecode in 'IL' if array(typecode).itemsize == 4)
+
+
+class Assembler:
+    """Single-pass assembler: encodes as it goes and back-patches forward branches once their label appears."""
+
+    @classmethod
+    def assemble(cls, lines):
+        """
+        :param lines: Iterable of assembly source lines
+        :return: array(WORD_TYPECODE) of encoded machine code, one 32-bit word per instruction
+        """
+        return cls._assemble_parsed(
+            (line_num, Parser.parse_line(line, line_num)) for line_num, line in enumerate(lines, start=1)
+        )
+
+    @classmethod
+    def assemble_source(cls, source):
+        """
+        :param source: Complete assembly source text
+        :return: array(WORD_TYPECODE) of encoded machine code, one 32-bit word per instruction
+        """
+        return cls._assemble_parsed(Parser.parse_source(source))
+
+    @classmethod
+    def _assemble_parsed(cls, parsed_lines):
+        machine_code = array(WORD_TYPECODE)
+        label_addresses = {}
+        # Forward branches still waiting for their label: label -> [(output index, instruction), ...]
+        fixups = {}
+
+        for line_num, parsed in parsed_lines:
+            if parsed is None:
+                continue
+            address = len(machine_code) * 4
+            if isinstance(parsed, tuple):
+                label = parsed[1]
+                if label in label_addresses:
+                    raise ValueError(f"Duplicate label '{label}' (line {line_num}).")
+                label_addresses[label] = address
+                # Re-encode every branch that was emitted before this label, now that its target is known.
+                for index, branch in fixups.pop(label, ()):
+                    machine_code[index] = branch.encode(label_addresses, index * 4)
+            elif isinstance(parsed, BranchInstruction) and parsed.label not in label_addresses:
+                fixups.setdefault(parsed.label, []).append((len(machine_code), parsed))
+                machine_code.append(0)
+            else:
+                machine_code.append(parsed.encode(label_addresses, address))
+
+        if fixups:
+            label, pending = next(iter(fixups.items()))
+            raise ValueError(f"Label '{label}' not found (line {pending[0][1].line_number}).")
+        return machine_code
+
+    @classmethod
+    def assemble_to_file(cls, source, output_file):
+        """
+        Assembles the source and writes the machine code as little-endian 32-bit words.
+
+        :param source: Complete assembly source text, or an iterable of assembly source lines
+        :param output_file: Binary file object opened for writing
+        :return: Number of instructions written
+        """
+        if isinstance(source, str):
+            machine_code = cls.assemble_source(source)
+        else:
+            machine_code = cls.assemble(source)
+        if sys.byteorder != 'little':
+            machine_code.byteswap()
+        # The array exposes its contiguous words through the buffer protocol, so one write sends the
+        # whole program without an intermediate bytes copy.
+        output_file.write(machine_code)
+        return len(machine_code)
@@ -1,16 +1,42 @@
+# Register name -> register number for the whole register file; names are case-insensitive like mnemonics.
+REG_NUM = {f"{prefix}{number}": number for prefix in "Rr" for number in range(32)}
+
+
+def register_number(register, line_number=None):
+    """
+    Looks up the number of a register name such as "R3" or "r3"; only R0..R31 exist.
+
+    :param register: Register operand as written in the source
+    :param line_number: The line number in the source assembly file, used in the error message
+    :return: Register number
+    """
+    try:
+        return REG_NUM[register]
+    except KeyError:
+        raise ValueError(f"Unknown register '{register}' (line {line_number}).") from None
+
+
 class Instruction:
     """Base class for an instruction."""
-    
-    def __init__(self, opcode, operands, line_number):
+
+    __slots__ = ("opcode", "_operands", "line_number")
+
+    def __init__(self, opcode, operands=None, line_number=None):
         """
         :param opcode: The name of the instruction (e.g., MOV, ADD, SUB, B)
-        :param operands: The list of operands for the instruction
+        :param operands: The list of operands for the instruction; optional, the built-in
+                         subclasses pass None and derive them from their named fields
         :param line_number: The line number in the source assembly file
         """
         self.opcode = opcode
-        self.operands = operands
+        self._operands = operands
         self.line_number = line_number
 
+    @property
+    def operands(self):
+        """The operands given to the constructor; the built-in subclasses return a read-only tuple instead."""
+        return self._operands
+
     def encode(self, label_addresses=None, current_address=0):
         """
         Converts the assembly instruction into machine code (binary/hex) - 32-bit binary representation.
@@ -32,15 +58,22 @@ class MoveInstruction(Instruction):
       bits [15:0]  = immediate value (lower 16 bits)
     """
 
+    __slots__ = ("destination_register", "immediate_value", "dest_reg_number")
+
+    _opcode_base = 1 << 28
+
     def __init__(self, destination_register, immediate_value, line_number):
-        super().__init__("MOV", [destination_register, immediate_value], line_number)
+        super().__init__("MOV", None, line_number)
         self.destination_register = destination_register
         self.immediate_value = immediate_value
+        self.dest_reg_number = register_number(destination_register, line_number)
+
+    @property
+    def operands(self):
+        return (self.destination_register, self.immediate_value)
 
     def encode(self, label_addresses=None, current_address=0):
-        dest_reg_number = int(self.destination_register[1:])  # Convert "R<number>" to an integer
-        machine_code = (1 << 28) | (dest_reg_number << 16) | (self.immediate_value & 0xFFFF)
-        return machine_code
+        return self._opcode_base | (self.dest_reg_number << 16) | (self.immediate_value & 0xFFFF)
 
 
 class AddInstruction(Instruction):
@@ -54,18 +87,26 @@ class AddInstruction(Instruction):
       bits [7:0]   = second source register
     """
 
+    __slots__ = ("destination_register", "source_register_1", "source_register_2",
+                 "dest_reg_number", "src1_reg_number", "src2_reg_number")
+
+    _opcode_base = 2 << 28
+
     def __init__(self, destination_register, source_register_1, source_register_2, line_number):
-        super().__init__("ADD", [destination_register, source_register_1, source_register_2], line_number)
+        super().__init__("ADD", None, line_number)
         self.destination_register = destination_register
         self.source_register_1 = source_register_1
         self.source_register_2 = source_register_2
+        self.dest_reg_number = register_number(destination_register, line_number)
+        self.src1_reg_number = register_number(source_register_1, line_number)
+        self.src2_reg_number = register_number(source_register_2, line_number)
+
+    @property
+    def operands(self):
+        return (self.destination_register, self.source_register_1, self.source_register_2)
 
     def encode(self, label_addresses=None, current_address=0):
-        dest_reg_number = int(self.destination_register[1:])
-        src1_reg_number = int(self.source_register_1[1:])
-        src2_reg_number = int(self.source_register_2[1:])
-        machine_code = (2 << 28) | (dest_reg_number << 16) | (src1_reg_number << 8) | src2_reg_number
-        return machine_code
+        return self._opcode_base | (self.dest_reg_number << 16) | (self.src1_reg_number << 8) | self.src2_reg_number
 
 
 class SubtractInstruction(Instruction):
@@ -79,18 +120,26 @@ class SubtractInstruction(Instruction):
       bits [7:0]   = second source register
     """
 
+    __slots__ = ("destination_register", "source_register_1", "source_register_2",
+                 "dest_reg_number", "src1_reg_number", "src2_reg_number")
+
+    _opcode_base = 3 << 28
+
     def __init__(self, destination_register, source_register_1, source_register_2, line_number):
-        super().__init__("SUB", [destination_register, source_register_1, source_register_2], line_number)
+        super().__init__("SUB", None, line_number)
         self.destination_register = destination_register
         self.source_register_1 = source_register_1
         self.source_register_2 = source_register_2
+        self.dest_reg_number = register_number(destination_register, line_number)
+        self.src1_reg_number = register_number(source_register_1, line_number)
+        self.src2_reg_number = register_number(source_register_2, line_number)
+
+    @property
+    def operands(self):
+        return (self.destination_register, self.source_register_1, self.source_register_2)
 
     def encode(self, label_addresses=None, current_address=0):
-        dest_reg_number = int(self.destination_register[1:])
-        src1_reg_number = int(self.source_register_1[1:])
-        src2_reg_number = int(self.source_register_2[1:])
-        machine_code = (3 << 28) | (dest_reg_number << 16) | (src1_reg_number << 8) | src2_reg_number
-        return machine_code
+        return self._opcode_base | (self.dest_reg_number << 16) | (self.src1_reg_number << 8) | self.src2_reg_number
 
 
 class BranchInstruction(Instruction):
@@ -102,15 +151,21 @@ class BranchInstruction(Instruction):
       bits [27:0]  = branch offset (relative to the next instruction)
     """
 
+    __slots__ = ("label",)
+
     def __init__(self, label, line_number):
-        super().__init__("B", [label], line_number)
+        super().__init__("B", None, line_number)
         self.label = label  # Target label name
 
+    @property
+    def operands(self):
+        return (self.label,)
+
     def encode(self, label_addresses=None, current_address=0):
-        if label_addresses is None or self.label not in label_addresses:
+        target_address = label_addresses.get(self.label) if label_addresses is not None else None
+        if target_address is None:
             raise ValueError(f"Label '{self.label}' not found (line {self.line_number}).")
 
-        target_address = label_addresses[self.label]
         # Compute offset in bytes (subtract current address and size of branch instruction)
         # Convert to number of instructions (assuming each instruction is 4 bytes)
         offset = (target_address - current_address - 4) // 4  
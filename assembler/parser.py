@@ -1,13 +1,98 @@
 from instruction import *
-import regex as re
+import re
+import sys
+
+
+def parse_immediate(text):
+    """
+    :param text: Immediate operand as written, e.g. "#5", "5", "#010" or "0x5"
+    :return: Integer value of the immediate
+    """
+    if text.startswith('#'):
+        text = text[1:]
+    try:
+        return int(text, 0)
+    except ValueError:
+        # Base 0 rejects decimals with leading zeros such as "010".
+        return int(text, 10)
+
+
 class Parser:
     """Parses assembly lines into instructions or label definitions."""
-    label_pattern = re.compile(r'^(\w+):')
-    instruction_pattern = re.compile(r'^\s*(\w+)(.*)$')
+    # The code part of every line that is neither blank nor comment-only; leading whitespace is
+    # anything str.strip() would remove. parse_source() normalises line breaks to '\n' first, so it
+    # sees the same lines as parse_line() fed from a file read with universal newlines.
+    source_pattern = re.compile(r'^[^\S\n]*(?P<code>[^\s;][^;\n]*)', re.MULTILINE)
 
     @classmethod
     def parse_line(cls, line, line_num):
+        """
+        :param line: One line of assembly source
+        :param line_num: The line number in the source assembly file
+        :return: None for blank/comment lines, ('label', name) for label definitions,
+                 otherwise an Instruction
+        """
         # Remove comments (anything after ';') and strip whitespace.
-        line = line.split(';')[0].strip()
+        line = line.partition(';')[0].strip()
         if not line:
-            return None
\ No newline at end of file
+            return None
+        return cls._parse_code(line, line_num)
+
+    @classmethod
+    def _parse_code(cls, line, line_num):
+        """
+        :param line: Non-empty line with comment and surrounding whitespace already removed
+        :param line_num: The line number in the source assembly file
+        :return: ('label', name) for label definitions, otherwise an Instruction
+        """
+        if line.endswith(':') and line[:-1].isidentifier():
+            return ('label', sys.intern(line[:-1]))
+
+        # Mnemonic is everything up to the first run of whitespace, operands are comma separated.
+        mnemonic, *rest = line.split(None, 1)
+        if not mnemonic.isidentifier():
+            raise ValueError(f"Invalid syntax on line {line_num}: {line}")
+        operands = [operand.strip() for operand in rest[0].split(',')] if rest else []
+        return cls.build_instruction(mnemonic.upper(), operands, line_num)
+
+    @classmethod
+    def parse_source(cls, source):
+        """
+        Parses a whole source buffer in a single regex scan instead of one parse_line() call per line.
+
+        :param source: Complete assembly source text; lines may end in LF, CRLF or CR
+        :return: Generator of (line number, parsed) pairs, where parsed is ('label', name) or an Instruction;
+                 blank and comment-only lines are skipped
+        """
+        if '\r' in source:
+            source = source.replace('\r\n', '\n').replace('\r', '\n')
+        line_num = 1
+        position = 0
+        for match in cls.source_pattern.finditer(source):
+            start = match.start()
+            line_num += source.count('\n', position, start)
+            position = start
+            yield line_num, cls._parse_code(match.group('code').rstrip(), line_num)
+
+    @staticmethod
+    def build_instruction(mnemonic, operands, line_num):
+        """
+        :param mnemonic: Upper-cased instruction name (MOV, ADD, SUB, B)
+        :param operands: The list of operand strings
+        :param line_num: The line number in the source assembly file
+        :return: The matching Instruction subclass instance
+        """
+        if mnemonic == "MOV" and len(operands) == 2:
+            try:
+                immediate = parse_immediate(operands[1])
+            except ValueError:
+                raise ValueError(f"Invalid immediate '{operands[1]}' (line {line_num}).") from None
+            return MoveInstruction(operands[0], immediate, line_num)
+        if mnemonic == "ADD" and len(operands) == 3:
+            return AddInstruction(operands[0], operands[1], operands[2], line_num)
+        if mnemonic == "SUB" and len(operands) == 3:
+            return SubtractInstruction(operands[0], operands[1], operands[2], line_num)
+        if mnemonic == "B" and len(operands) == 1:
+            # Interned like label definitions, so label table lookups compare by identity.
+            return BranchInstruction(sys.intern(operands[0]), line_num)
+        raise ValueError(f"Unknown instruction or wrong operand count on line {line_num}: {mnemonic} {', '.join(operands)}")
@@ -0,0 +1,74 @@
+import io
+
+import pytest
+
+from assembler import Assembler
+
+SOURCE = """\
+start:
+    MOV R1, #5
+    B skip          ; forward branch, patched when 'skip' appears
+    MOV R2, #1
+skip:
+    ADD R3, R1, R2
+    B start         ; backward branch, encoded immediately
+    SUB R4, R3, R1
+    B end
+end:
+"""
+
+EXPECTED = [
+    0x10010005,
+    0x40000001,
+    0x10020001,
+    0x20030102,
+    0x4FFFFFFB,
+    0x30040301,
+    0x40000000,
+]
+
+
+def test_assemble_lines():
+    assert list(Assembler.assemble(SOURCE.splitlines())) == EXPECTED
+
+
+def test_assemble_source():
+    assert list(Assembler.assemble_source(SOURCE)) == EXPECTED
+
+
+def test_forward_branches_to_same_label_are_all_patched():
+    machine_code = Assembler.assemble_source("B done\nB done\nMOV R1, #1\ndone:\nB done\n")
+    assert list(machine_code) == [0x40000002, 0x40000001, 0x10010001, 0x4FFFFFFF]
+
+
+def test_duplicate_label():
+    with pytest.raises(ValueError, match=r"Duplicate label 'a' \(line 3\)"):
+        Assembler.assemble_source("a:\nMOV R1, #1\na:\n")
+
+
+def test_unresolved_label_reports_first_use():
+    with pytest.raises(ValueError, match=r"Label 'nowhere' not found \(line 2\)"):
+        Assembler.assemble_source("MOV R1, #1\nB nowhere\nB nowhere\n")
+
+
+def test_assemble_source_keeps_lines_with_unusual_leading_whitespace():
+    assert list(Assembler.assemble_source("loop:\n\fB loop\n")) == list(Assembler.assemble(["loop:", "\fB loop"]))
+    assert len(Assembler.assemble_source("loop:\n\fB loop\n")) == 1
+
+
+def test_words_are_32_bit():
+    assert Assembler.assemble_source(SOURCE).itemsize == 4
+
+
+@pytest.mark.parametrize("source", [SOURCE, SOURCE.splitlines()])
+def test_assemble_to_file_writes_little_endian_words(source):
+    output_file = io.BytesIO()
+    assert Assembler.assemble_to_file(source, output_file) == len(EXPECTED)
+    assert output_file.getvalue() == b"".join(word.to_bytes(4, "little") for word in EXPECTED)
+
+
+@pytest.mark.parametrize("newline", ["\r", "\r\n"])
+def test_assemble_source_accepts_cr_line_breaks(newline):
+    source = SOURCE.replace("\n", newline)
+    assert list(Assembler.assemble_source(source)) == EXPECTED
+    assert list(Assembler.assemble(io.StringIO(source, newline=None))) == EXPECTED
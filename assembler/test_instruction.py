@@ -0,0 +1,49 @@
+import pytest
+
+from instruction import (
+    AddInstruction, BranchInstruction, Instruction, MoveInstruction, SubtractInstruction, register_number,
+)
+
+
+def test_register_names_are_case_insensitive():
+    assert register_number("R7") == 7
+    assert register_number("r7") == 7
+    assert MoveInstruction("r1", 1, 1).encode() == 0x10010001
+
+
+@pytest.mark.parametrize("register", ["R32", "X1", "R", "R01"])
+def test_unknown_register_reports_line(register):
+    with pytest.raises(ValueError, match=rf"Unknown register '{register}' \(line 3\)"):
+        register_number(register, 3)
+
+
+def test_operands_are_read_only_tuples():
+    instruction = MoveInstruction("R1", 5, 1)
+    assert instruction.operands == ("R1", 5)
+    assert not hasattr(instruction, "__dict__")
+    with pytest.raises(AttributeError):
+        instruction.operands = ("R2", 6)
+
+
+@pytest.mark.parametrize("instruction, address, expected", [
+    (MoveInstruction("R1", 5, 1), 0, 0x10010005),
+    (MoveInstruction("R7", -1, 1), 0, 0x1007FFFF),
+    (AddInstruction("R2", "R1", "R3", 1), 0, 0x20020103),
+    (SubtractInstruction("R4", "R2", "R1", 1), 0, 0x30040201),
+    (BranchInstruction("start", 1), 8, 0x4FFFFFFD),
+    (BranchInstruction("end", 1), 16, 0x40000001),
+])
+def test_encode(instruction, address, expected):
+    assert instruction.encode({"start": 0, "end": 24}, address) == expected
+
+
+@pytest.mark.parametrize("label_addresses", [None, {}, {"other": 0}])
+def test_branch_to_unknown_label(label_addresses):
+    with pytest.raises(ValueError, match=r"Label 'missing' not found \(line 9\)"):
+        BranchInstruction("missing", 9).encode(label_addresses, 0)
+
+
+def test_base_instruction_keeps_given_operands():
+    instruction = Instruction("NOP", ["x"], 2)
+    assert instruction.operands == ["x"]
+    assert instruction.line_number == 2
@@ -0,0 +1,93 @@
+import pytest
+
+from instruction import AddInstruction, BranchInstruction, MoveInstruction
+from parser import Parser, parse_immediate
+
+
+def describe(parsed):
+    """Reduces a parse result to something comparable with ==."""
+    if parsed is None or isinstance(parsed, tuple):
+        return parsed
+    return (type(parsed).__name__, parsed.operands, parsed.line_number)
+
+
+def parse_both(line):
+    """Parses one line through parse_line() and parse_source(), returning both descriptions."""
+    results = []
+    for parse in (lambda: Parser.parse_line(line, 1),
+                  lambda: next((parsed for _, parsed in Parser.parse_source(line)), None)):
+        try:
+            results.append(describe(parse()))
+        except ValueError:
+            results.append(ValueError)
+    return results
+
+
+def test_parse_line_label_and_instruction():
+    assert Parser.parse_line("loop:   ; top of loop", 1) == ('label', 'loop')
+    instruction = Parser.parse_line("  add R2, R1, R3 ; sum", 7)
+    assert isinstance(instruction, AddInstruction)
+    assert instruction.operands == ('R2', 'R1', 'R3')
+    assert instruction.line_number == 7
+
+
+def test_parse_line_skips_blank_and_comment_lines():
+    assert Parser.parse_line("", 1) is None
+    assert Parser.parse_line("   ; only a comment", 1) is None
+
+
+def test_parse_source_line_numbers():
+    parsed = list(Parser.parse_source("start:\n\n  ; comment\n  MOV R1, #5\nB start\n"))
+    assert [line_num for line_num, _ in parsed] == [1, 4, 5]
+    assert parsed[0][1] == ('label', 'start')
+    assert isinstance(parsed[1][1], MoveInstruction)
+    assert isinstance(parsed[2][1], BranchInstruction)
+
+
+@pytest.mark.parametrize("line", [
+    "\fB loop",
+    "\vMOV R1, #1",
+    " MOV R1, #1",
+    "loop: \v",
+    "loop:\r",
+    "1loop:",
+    "loop: MOV R1, #1",
+    "  ,,",
+    "MOV R1, #1 \f; comment",
+    "\f",
+    "\f ; comment",
+])
+def test_parse_line_and_parse_source_agree(line):
+    from_line, from_source = parse_both(line)
+    assert from_line == from_source
+
+
+def test_parse_source_rejects_unparseable_lines():
+    with pytest.raises(ValueError, match="line 2"):
+        list(Parser.parse_source("MOV R1, #1\n  ,,\n"))
+
+
+@pytest.mark.parametrize("text, value", [("#5", 5), ("5", 5), ("0x1F", 31), ("#010", 10), ("-1", -1)])
+def test_parse_immediate(text, value):
+    assert parse_immediate(text) == value
+
+
+@pytest.mark.parametrize("text", ["##5", "abc", "#"])
+def test_parse_immediate_rejects(text):
+    with pytest.raises(ValueError):
+        parse_immediate(text)
+
+
+def test_bad_immediate_reports_line():
+    with pytest.raises(ValueError, match=r"Invalid immediate '#abc' \(line 4\)"):
+        Parser.parse_line("MOV R1, #abc", 4)
+
+
+def test_lowercase_source():
+    instruction = Parser.parse_line("mov r1, #1", 1)
+    assert instruction.encode() == 0x10010001
+
+
+def test_parse_source_line_numbers_with_cr_line_breaks():
+    with pytest.raises(ValueError, match="line 3"):
+        list(Parser.parse_source("loop:\rB loop\r\n  ,,\r"))